@@ -25,11 +25,14 @@ import logging
 from datetime import datetime, timezone
 from typing import Any
 
-import google.auth
-from google.api_core.exceptions import GoogleAPICallError
+from google.api_core.exceptions import (
+    GoogleAPICallError,
+    InternalServerError,
+    ServiceUnavailable,
+    TooManyRequests,
+)
+from google.cloud import dataflow_v1beta3
 from google.cloud.functions_v1.context import Context
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 from lsst.dax.ppdbx.gcp.env import require_env
 from lsst.dax.ppdbx.gcp.log_config import setup_logging
 
@@ -44,8 +47,13 @@ SERVICE_ACCOUNT_EMAIL = require_env("SERVICE_ACCOUNT_EMAIL")
 TEMP_LOCATION = require_env("TEMP_LOCATION")
 TOPIC_NAME = require_env("TOPIC_NAME")
 
-_credentials, _ = google.auth.default()
-_dataflow_client = build("dataflow", "v1b3", credentials=_credentials)
+# Launch environment shared by all Dataflow jobs started by this function
+_LAUNCH_ENVIRONMENT = dataflow_v1beta3.FlexTemplateRuntimeEnvironment(
+    service_account_email=SERVICE_ACCOUNT_EMAIL,
+    temp_location=TEMP_LOCATION,
+)
+
+_dataflow_client = dataflow_v1beta3.FlexTemplatesServiceClient()
 
 
 def trigger_stage_chunk(event: dict[str, Any], context: Context) -> None:
@@ -61,14 +69,14 @@ def trigger_stage_chunk(event: dict[str, Any], context: Context) -> None:
         Metadata of triggering event including `event_id`.
     """
     try:
-        message = base64.b64decode(event["data"]).decode("utf-8")
+        payload = base64.b64decode(event["data"])
     except Exception:
         logging.exception("Malformed or missing Pub/Sub data payload")
         return
 
     try:
-        data = json.loads(message)
-    except json.JSONDecodeError:
+        data = json.loads(payload)
+    except (json.JSONDecodeError, UnicodeDecodeError):
         logging.exception("Failed to decode JSON from Pub/Sub message")
         return
 
@@ -80,56 +88,54 @@ def trigger_stage_chunk(event: dict[str, Any], context: Context) -> None:
         logging.exception("Missing required key in Pub/Sub message")
         return
 
+    # The flex template parameters are a string map, so reject values which
+    # cannot be passed to the template instead of failing to build the request.
+    if not isinstance(dataset_id, str) or not isinstance(folder, str):
+        logging.error(
+            "Invalid 'dataset' or 'folder' in Pub/Sub message: %s, %s",
+            dataset_id,
+            folder,
+        )
+        return
+
     timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d%H%M%S")
     job_name = f"stage-chunk-{chunk_id}-{timestamp}"
 
-    launch_body = {
-        "launchParameter": {
-            "jobName": job_name,
-            "containerSpecGcsPath": DATAFLOW_TEMPLATE_PATH,
-            "parameters": {
+    launch_request = dataflow_v1beta3.LaunchFlexTemplateRequest(
+        project_id=PROJECT_ID,
+        location=REGION,
+        launch_parameter=dataflow_v1beta3.LaunchFlexTemplateParameter(
+            job_name=job_name,
+            container_spec_gcs_path=DATAFLOW_TEMPLATE_PATH,
+            parameters={
                 "dataset_id": dataset_id,
-                "chunk_id": chunk_id,
+                "chunk_id": str(chunk_id),
                 "folder": folder,
                 "topic_name": TOPIC_NAME,
             },
-            "environment": {
-                "serviceAccountEmail": SERVICE_ACCOUNT_EMAIL,
-                "tempLocation": TEMP_LOCATION,
-            },
-        }
-    }
+            environment=_LAUNCH_ENVIRONMENT,
+        ),
+    )
 
     logging.info("Launching Dataflow job %s to stage chunk %s", job_name, chunk_id)
 
     try:
-        request = (
-            _dataflow_client.projects()
-            .locations()
-            .flexTemplates()
-            .launch(projectId=PROJECT_ID, location=REGION, body=launch_body)
-        )
-        response = request.execute()
+        response = _dataflow_client.launch_flex_template(request=launch_request)
 
-        if "job" not in response:
+        if not response.job.id:
             logging.error("Dataflow API response missing 'job' field: %s", response)
             return
 
-        job_id = response.get("job", {}).get("id", "unknown")
-        logging.info(f"Dataflow job launched: {job_id}")
-
-    except HttpError as e:
-        if e.resp.status in [429, 500, 503]:
-            logging.warning("Retryable HTTP error (%s): %s", e.resp.status, e)
-            raise  # Will trigger retry
-        else:
-            logging.error("Non-retryable HTTP error: %s", e)
-            return  # Acknowledge message
+        logging.info(f"Dataflow job launched: {response.job.id}")
 
-    except GoogleAPICallError:
-        logging.exception("Retryable GCP API error")
+    except (TooManyRequests, InternalServerError, ServiceUnavailable) as e:
+        logging.warning("Retryable Dataflow API error (%s): %s", e.code, e)
         raise  # Will trigger retry
 
+    except GoogleAPICallError as e:
+        logging.error("Non-retryable Dataflow API error (%s): %s", e.code, e)
+        return  # Acknowledge message
+
     except Exception:
         logging.exception("Unexpected error during job submission")
         return  # Acknowledge message
@@ -24,13 +24,10 @@ import json
 import logging
 import posixpath
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from urllib.parse import urlparse
 
 import apache_beam
-from apache_beam import PCollection
-from apache_beam.io.gcp.bigquery import BigQueryDisposition, WriteToBigQuery
-from apache_beam.io.parquetio import ReadFromParquet
 from apache_beam.options.pipeline_options import (
     GoogleCloudOptions,
     PipelineOptions,
@@ -46,29 +43,6 @@ cloud_logging.Client().setup_logging()
 logging.getLogger().setLevel(logging.INFO)
 
 
-class BeamSuppressUpdateDestinationSchemaWarning(logging.Filter):
-    """Suppresses the UpdateDestinationSchema warning from Apache Beam."""
-
-    def filter(self, record: logging.LogRecord) -> bool:
-        """Suppress the UpdateDestinationSchema warning.
-
-        Parameters
-        ----------
-        record : `logging.LogRecord`
-            The log record to filter.
-        """
-        if record.name == "apache_beam.transforms.core":
-            message = str(record.getMessage())
-            if "No iterator is returned by the process method" in message:
-                return False
-        return True
-
-
-logging.getLogger("apache_beam.transforms.core").addFilter(
-    BeamSuppressUpdateDestinationSchemaWarning()
-)
-
-
 class CustomOptions(PipelineOptions):
     """Custom options for the pipeline."""
 
@@ -99,56 +73,125 @@ class CustomOptions(PipelineOptions):
         )
 
 
-def read_parquet(pipeline: apache_beam.Pipeline, folder: str, name: str) -> PCollection:
-    """Read Parquet files from GCS.
+class LoadParquetToBigQuery(apache_beam.DoFn):
+    """Load Parquet files from GCS into BigQuery tables using load jobs.
+
+    Each element is a tuple of ``(parquet_uri, table_id, job_id)``. The file
+    is loaded by BigQuery directly from GCS, so the rows are never read into
+    the pipeline. The ``job_id`` may be `None` to let BigQuery generate one.
+
+    When a ``job_id`` is given, each attempt to load a file uses a
+    deterministic job ID: ``job_id`` first, then ``job_id-retry1``,
+    ``job_id-retry2`` and so on. A retried bundle waits on an attempt that
+    is still running or has succeeded, and only submits the next attempt
+    when the previous one failed. Load jobs are atomic, so the data is never
+    appended twice.
+
+    The main session is not pickled for the workers, so the modules used on
+    the workers are imported inside the methods.
 
     Parameters
     ----------
-    pipeline : `apache_beam.Pipeline`
-        The Apache Beam pipeline.
-    folder : `str`
-        The GCS folder containing Parquet files.
-    name : `str`
-        The name of the Parquet file to read (without extension).
-
-    Returns
-    -------
-    transform: `apache_beam.PTransform`
-        The transform to read the Parquet file.
+    project_id : `str`
+        The GCP project ID in which the load jobs are run.
+    dataset_id : `str`
+        The BigQuery dataset containing the staging tables. Its location is
+        used for all load jobs.
     """
-    parquet_path = posixpath.join(folder.rstrip("/"), name.lstrip("/"))
-    logging.info("Reading Parquet file: %s", parquet_path)
-    return pipeline | f"Read{name}" >> ReadFromParquet(f"{parquet_path}")
 
+    def __init__(self, project_id: str, dataset_id: str):
+        self._project_id = project_id
+        self._dataset_id = dataset_id
+        self._client = None
+        self._location = None
 
-def write_to_bigquery(
-    pcoll: apache_beam.PCollection,
-    table_fqn: str,
-    temp_location: str,
-) -> PCollection:
-    """Write PCollection to BigQuery.
+    def setup(self) -> None:
+        """Create the BigQuery client and look up the dataset location."""
+        from google.cloud import bigquery
+
+        self._client = bigquery.Client(project=self._project_id)
+        dataset = self._client.get_dataset(f"{self._project_id}.{self._dataset_id}")
+        self._location = dataset.location
+
+    def process(self, element: tuple[str, str, Optional[str]]) -> Iterator[str]:
+        """Run a load job for a single Parquet file and wait for it to finish.
+
+        Parameters
+        ----------
+        element : `tuple` [`str`, `str`, `str` or `None`]
+            The Parquet file URI, the fully qualified table ID in the format
+            ``project_id.dataset_id.table_name`` and the load job ID.
+
+        Yields
+        ------
+        table_id : `str`
+            The ID of the table that was loaded.
+        """
+        import logging
+
+        from google.api_core.exceptions import Conflict
+        from google.cloud import bigquery
+
+        parquet_uri, table_id, job_id = element
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            create_disposition=bigquery.CreateDisposition.CREATE_NEVER,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+        )
+        logging.info("Loading %s into BigQuery table %s", parquet_uri, table_id)
+
+        attempt = 0
+        while True:
+            attempt_id = job_id if not attempt else f"{job_id}-retry{attempt}"
+            try:
+                job = self._client.load_table_from_uri(
+                    parquet_uri,
+                    table_id,
+                    job_id=attempt_id,
+                    location=self._location,
+                    job_config=job_config,
+                )
+                break
+            except Conflict:
+                # A previous attempt of this bundle already submitted this
+                # job. Wait on it unless it failed, in which case submit the
+                # next attempt.
+                job = self._client.get_job(attempt_id, location=self._location)
+                if job.state != "DONE" or job.error_result is None:
+                    logging.info(
+                        "Load job %s already exists, waiting for it", attempt_id
+                    )
+                    break
+                logging.warning(
+                    "Load job %s failed with %s, resubmitting",
+                    attempt_id,
+                    job.error_result,
+                )
+                attempt += 1
+
+        job.result()
+        logging.info("Loaded %s rows into BigQuery table %s", job.output_rows, table_id)
+        yield table_id
+
+
+def _get_load_job_id(job_name: Optional[str], file_name: str) -> Optional[str]:
+    """Return a deterministic BigQuery load job ID for a Parquet file.
 
     Parameters
     ----------
-    pcoll : `apache_beam.PCollection`
-        The PCollection to write to BigQuery.
-    table_fqn : `str`
-        The fully qualified name of the BigQuery table in the format `project_id:dataset_id.table_name`.
-    temp_location : `str`
-        The GCS path for temporary files.
+    job_name : `str` or `None`
+        The name of the pipeline job, if set.
+    file_name : `str`
+        The name of the Parquet file being loaded.
 
     Returns
     -------
-    transform: `apache_beam.PTransform`
-        The transform to write the PCollection to BigQuery.
+    job_id : `str` or `None`
+        The load job ID, or `None` if the pipeline has no job name.
     """
-    logging.info("Writing to BigQuery table %s", table_fqn)
-    return pcoll | f"Write{table_fqn}" >> WriteToBigQuery(
-        table=table_fqn,
-        create_disposition=BigQueryDisposition.CREATE_NEVER,
-        write_disposition=BigQueryDisposition.WRITE_APPEND,
-        custom_gcs_temp_location=temp_location,
-    )
+    if not job_name:
+        return None
+    return f"{job_name}-{Path(file_name).stem}"
 
 
 def parse_folder(folder: str) -> tuple[str, str]:
@@ -245,10 +288,9 @@ def run(argv: Optional[list[str]] = None) -> None:
     custom_options = options.view_as(CustomOptions)
 
     gcp_options = options.view_as(GoogleCloudOptions)
-    options.view_as(SetupOptions).save_main_session = True
+    options.view_as(SetupOptions).save_main_session = False
 
-    temp_location = gcp_options.temp_location
-    if not temp_location:
+    if not gcp_options.temp_location:
         raise ValueError("GCP temp_location must be set in pipeline options.")
 
     dataset_id = custom_options.dataset_id
@@ -267,10 +309,9 @@ def run(argv: Optional[list[str]] = None) -> None:
 
     try:
         manifest = read_manifest(chunk_id, folder)
-        logging.info(
-            "Read manifest contents: %s",
-            manifest.model_dump_json(),
-        )
+        # Only serialize the manifest when it will actually be logged.
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Read manifest contents: %s", manifest.model_dump_json())
     except Exception:
         logging.exception("Failed to read manifest file from GCS")
         raise
@@ -289,21 +330,34 @@ def run(argv: Optional[list[str]] = None) -> None:
         if name != UpdateRecords.PARQUET_FILE_NAME
     ]
 
+    # A chunk containing only update records has no tables to load, so mark
+    # it as staged without constructing and running a pipeline.
+    if not parquet_files:
+        logging.info("Chunk %d has no table files. Skipping pipeline.", chunk_id)
+        update_chunk_status(project_id, topic_name, chunk_id)
+        return
+
+    # TODO: This table name will be changed by DM-54681 to use the staging
+    # dataset with the same table name as the source, e.g., 'DiaObject'. For
+    # now, we use the conventional staging table name in the single dataset.
+    load_requests = [
+        (
+            posixpath.join(folder.rstrip("/"), file_name.lstrip("/")),
+            f"{project_id}.{dataset_id}._{Path(file_name).stem}_staging",
+            _get_load_job_id(gcp_options.job_name, file_name),
+        )
+        for file_name in parquet_files
+    ]
+
+    # Fan out the tables across workers so the load jobs run concurrently.
     with apache_beam.Pipeline(options=options) as pipeline:
-        for file_name in parquet_files:
-            data = read_parquet(pipeline, folder, file_name)
-
-            # TODO: This table name will be changed by DM-54681 to use the
-            # staging dataset with the same table name as the source, e.g.,
-            # 'DiaObject'. For now, we use the conventional staging table name
-            # in the single dataset.
-            table_fqn = f"{project_id}:{dataset_id}._{Path(file_name).stem}_staging"
-
-            write_to_bigquery(
-                data,
-                table_fqn,
-                temp_location,
-            )
+        (
+            pipeline
+            | "CreateLoadRequests" >> apache_beam.Create(load_requests)
+            | "Reshuffle" >> apache_beam.Reshuffle()
+            | "LoadParquetToBigQuery"
+            >> apache_beam.ParDo(LoadParquetToBigQuery(project_id, dataset_id))
+        )
 
     # Update the chunk status in the tracking database.
     update_chunk_status(project_id, topic_name, chunk_id)
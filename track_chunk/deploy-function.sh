@@ -2,6 +2,17 @@
 
 set -euxo pipefail
 
+# Number of Pub/Sub events a single instance may handle at the same time
+CONCURRENCY=${CONCURRENCY:-8}
+
+# Maximum number of function instances. Every event being handled uses one
+# connection to the tracking database, so the function can open up to
+# CONCURRENCY x MAX_INSTANCES connections at once. Keep that product below
+# the database server's max_connections, less what other clients use.
+MAX_INSTANCES=${MAX_INSTANCES:-10}
+
+LOG_LEVEL=${LOG_LEVEL:-INFO}
+
 # Deploy the Cloud Function
 gcloud functions deploy track-chunk \
   --runtime=python313 \
@@ -10,7 +21,9 @@ gcloud functions deploy track-chunk \
   --entry-point=track_chunk \
   --service-account=${SERVICE_ACCOUNT_EMAIL} \
   --trigger-topic=track-chunk-topic \
-  --set-env-vars "PPDB_CONFIG_URI=${PPDB_CONFIG_URI},PPDB_USE_SECRET_MANAGER=true" \
+  --set-env-vars "PPDB_CONFIG_URI=${PPDB_CONFIG_URI},PPDB_USE_SECRET_MANAGER=true,LOG_LEVEL=${LOG_LEVEL}" \
   --gen2 \
   --memory=4Gi \
+  --concurrency=${CONCURRENCY} \
+  --max-instances=${MAX_INSTANCES} \
   --quiet
@@ -38,16 +38,16 @@ ppdb = PpdbBigQuery.from_env()
 def track_chunk(event: dict[str, Any], context: Any) -> None:
     try:
         try:
-            message = base64.b64decode(event["data"]).decode("utf-8")
-        except (KeyError, binascii.Error, UnicodeDecodeError) as e:
+            payload = base64.b64decode(event["data"])
+        except (KeyError, binascii.Error) as e:
             raise Exception("Malformed or missing Pub/Sub data payload") from e
 
         try:
-            data = json.loads(message)
-        except json.JSONDecodeError as e:
+            data = json.loads(payload)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise Exception("Failed to decode JSON from Pub/Sub message") from e
 
-        logging.info("Received Pub/Sub message: %s", data)
+        logging.debug("Received Pub/Sub message: %s", data)
 
         operation = data.get("operation")
         if not operation: